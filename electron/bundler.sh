@@ -18,9 +18,9 @@ echo "Electron Binary: $ELECTRON_BINARY"
 TEMP_DIR=$(mktemp -d)
 trap "rm -rf $TEMP_DIR" EXIT
 
-# Extract Electron binary
+# Extract Electron binary (only Electron.app; skip the top-level license files)
 echo "Extracting Electron binary..."
-unzip -q "$ELECTRON_BINARY" -d "$TEMP_DIR"
+unzip -q "$ELECTRON_BINARY" 'Electron.app/*' -d "$TEMP_DIR"
 
 # Create app directory structure
 APP_DIR="$TEMP_DIR/Electron.app/Contents/Resources/app"
@@ -76,8 +76,10 @@ mv "$TEMP_DIR/Electron.app" "$TEMP_DIR/$APP_NAME.app"
 PLIST_FILE="$TEMP_DIR/$APP_NAME.app/Contents/Info.plist"
 if [ -f "$PLIST_FILE" ]; then
     echo "Updating Info.plist..."
-    sed -i '' "s/>Electron</>$APP_NAME</g" "$PLIST_FILE"
-    sed -i '' "s/>com.github.Electron</>com.gazel.$APP_NAME</g" "$PLIST_FILE"
+    sed -i '' \
+        -e "s/>Electron</>$APP_NAME</g" \
+        -e "s/>com.github.Electron</>com.gazel.$APP_NAME</g" \
+        "$PLIST_FILE"
 fi
 
 # Create tar archive
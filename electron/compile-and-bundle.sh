@@ -55,6 +55,15 @@ cleanup() {
 }
 trap cleanup EXIT
 
+# Copy a directory tree, cloning files via clonefile(2) (cp -c) on APFS and
+# falling back to a regular copy where cloning is unsupported.
+copy_tree() {
+  if ! cp -cR "$1" "$2" 2>/dev/null; then
+    rm -rf "$2"
+    cp -R "$1" "$2"
+  fi
+}
+
 if [[ -n "${NODE_MODULES_ROOT}" && "${NODE_MODULES_ROOT}" != /* ]]; then
   NODE_MODULES_ROOT="${PWD}/${NODE_MODULES_ROOT}"
 fi
@@ -136,7 +145,7 @@ if [[ ! -d "${DIST_DIR}/renderer" ]]; then
 fi
 
 echo "Unpacking Electron binary..."
-unzip -q "${ELECTRON_ZIP}" -d "${TEMP_DIR}"
+unzip -q "${ELECTRON_ZIP}" 'Electron.app/*' -d "${TEMP_DIR}"
 
 ORIGINAL_APP="${TEMP_DIR}/Electron.app"
 APP_PATH="${TEMP_DIR}/${APP_NAME}.app"
@@ -154,12 +163,12 @@ APP_DIR="${APP_RESOURCES}/app"
 mkdir -p "${APP_DIR}"
 
 echo "Copying electron-vite bundles..."
-cp -R "${DIST_DIR}/main" "${APP_DIR}/main"
-cp -R "${DIST_DIR}/preload" "${APP_DIR}/preload"
-cp -R "${DIST_DIR}/renderer" "${APP_DIR}/renderer"
+copy_tree "${DIST_DIR}/main" "${APP_DIR}/main"
+copy_tree "${DIST_DIR}/preload" "${APP_DIR}/preload"
+copy_tree "${DIST_DIR}/renderer" "${APP_DIR}/renderer"
 
 if [[ -d "${WORKSPACE_DIR}/electron/assets" ]]; then
-  cp -R "${WORKSPACE_DIR}/electron/assets" "${APP_DIR}/assets"
+  copy_tree "${WORKSPACE_DIR}/electron/assets" "${APP_DIR}/assets"
 fi
 
 cat > "${APP_DIR}/package.json" <<'EOF'
@@ -43,8 +43,8 @@ shift 5
 TEMP_DIR=$(mktemp -d)
 trap "rm -rf $TEMP_DIR" EXIT
 
-# Extract Electron binary
-unzip -q "$ELECTRON_BINARY" -d "$TEMP_DIR"
+# Extract Electron binary (only Electron.app; skip the top-level license files)
+unzip -q "$ELECTRON_BINARY" 'Electron.app/*' -d "$TEMP_DIR"
 
 # Create app directory structure
 APP_DIR="$TEMP_DIR/Electron.app/Contents/Resources/app"